@@ -144,10 +144,10 @@ def add_boxer() -> Response:
                 "message": "Invalid input types: name should be a string, weight/height/reach should be numbers, age should be an integer"
             }), 400)
 
-        app.logger.info(f"Adding boxer: {name}, {weight}kg, {height}cm, {reach} inches, {age} years old")
+        app.logger.info("Adding boxer: %s, %skg, %scm, %s inches, %s years old", name, weight, height, reach, age)
         boxers_model.create_boxer(name, weight, height, reach, age)
 
-        app.logger.info(f"Boxer added successfully: {name}")
+        app.logger.info("Boxer added successfully: %s", name)
         return make_response(jsonify({
             "status": "success",
             "message": f"Boxer '{name}' added successfully"
@@ -178,7 +178,7 @@ def delete_boxer(boxer_id: int) -> Response:
 
     """
     try:
-        app.logger.info(f"Received request to delete boxer with ID {boxer_id}")
+        app.logger.info("Received request to delete boxer with ID %s", boxer_id)
 
         # Check if the boxer exists before attempting to delete
         boxer = boxers_model.get_boxer_by_id(boxer_id)
@@ -190,7 +190,7 @@ def delete_boxer(boxer_id: int) -> Response:
             }), 400)
 
         boxers_model.delete_boxer(boxer_id)
-        app.logger.info(f"Successfully deleted boxer with ID {boxer_id}")
+        app.logger.info("Successfully deleted boxer with ID %s", boxer_id)
 
         return make_response(jsonify({
             "status": "success",
@@ -222,7 +222,7 @@ def get_boxer_by_id(boxer_id: int) -> Response:
 
     """
     try:
-        app.logger.info(f"Received request to retrieve boxer with ID {boxer_id}")
+        app.logger.info("Received request to retrieve boxer with ID %s", boxer_id)
 
         boxer = boxers_model.get_boxer_by_id(boxer_id)
 
@@ -233,7 +233,7 @@ def get_boxer_by_id(boxer_id: int) -> Response:
                 "message": f"Boxer with ID {boxer_id} not found"
             }), 400)
 
-        app.logger.info(f"Successfully retrieved boxer: {boxer}")
+        app.logger.info("Successfully retrieved boxer: %s", boxer)
         return make_response(jsonify({
             "status": "success",
             "boxer": boxer
@@ -264,7 +264,7 @@ def get_boxer_by_name(boxer_name: str) -> Response:
 
     """
     try:
-        app.logger.info(f"Received request to retrieve boxer with name '{boxer_name}'")
+        app.logger.info("Received request to retrieve boxer with name '%s'", boxer_name)
 
         boxer = boxers_model.get_boxer_by_name(boxer_name)
 
@@ -275,7 +275,7 @@ def get_boxer_by_name(boxer_name: str) -> Response:
                 "message": f"Boxer '{boxer_name}' not found"
             }), 400)
 
-        app.logger.info(f"Successfully retrieved boxer: {boxer}")
+        app.logger.info("Successfully retrieved boxer: %s", boxer)
         return make_response(jsonify({
             "status": "success",
             "boxer": boxer
@@ -314,7 +314,7 @@ def bout() -> Response:
 
         winner = ring_model.fight()
 
-        app.logger.info(f"Fight complete. Winner: {winner}")
+        app.logger.info("Fight complete. Winner: %s", winner)
         return make_response(jsonify({
             "status": "success",
             "message": "Fight complete",
@@ -394,7 +394,7 @@ def enter_ring() -> Response:
                 "message": "You must name a boxer"
             }), 400)
 
-        app.logger.info(f"Attempting to enter {boxer_name} into the ring.")
+        app.logger.info("Attempting to enter %s into the ring.", boxer_name)
 
         boxer = boxers_model.get_boxer_by_name(boxer_name)
 
@@ -416,7 +416,7 @@ def enter_ring() -> Response:
 
         boxers = ring_model.get_boxers()
 
-        app.logger.info(f"Boxer '{boxer_name}' entered the ring. Current boxers: {boxers}")
+        app.logger.info("Boxer '%s' entered the ring. Current boxers: %s", boxer_name, boxers)
 
         return make_response(jsonify({
             "status": "success",
@@ -449,7 +449,7 @@ def get_boxers() -> Response:
 
         boxers = ring_model.get_boxers()
 
-        app.logger.info(f"Retrieved {len(boxers)} boxer(s).")
+        app.logger.info("Retrieved %s boxer(s).", len(boxers))
         return make_response(jsonify({
             "status": "success",
             "boxers": boxers
@@ -499,11 +499,11 @@ def get_leaderboard() -> Response:
                 "message": f"Invalid sort parameter '{sort_by}'. Must be one of: {', '.join(valid_sort_fields)}"
             }), 400)
 
-        app.logger.info(f"Generating leaderboard sorted by '{sort_by}'")
+        app.logger.info("Generating leaderboard sorted by '%s'", sort_by)
 
         leaderboard_data = boxers_model.get_leaderboard(sort_by)
 
-        app.logger.info(f"Leaderboard generated successfully. {len(leaderboard_data)} boxers ranked.")
+        app.logger.info("Leaderboard generated successfully. %s boxers ranked.", len(leaderboard_data))
 
         return make_response(jsonify({
             "status": "success",
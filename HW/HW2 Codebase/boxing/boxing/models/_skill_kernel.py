@@ -0,0 +1,17 @@
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernel runs as plain Python.
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def skill(weight: int, name_len: int, reach: float, age: int) -> float:
+    # Numeric core of the fighting skill formula, kept free of attribute
+    # access and logging so Numba can compile it when available.
+    # Branchless form of: -1 if age < 25 else (-2 if age > 35 else 0)
+    age_modifier = -(age < 25) - 2 * (age > 35)
+    return (weight * name_len) + (reach * 0.1) + age_modifier
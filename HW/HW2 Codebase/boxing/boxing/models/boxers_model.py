@@ -23,6 +23,7 @@ class Boxer:
 
     def __post_init__(self):
         self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        self.name_len = len(self.name)  # Precomputed for the fighting skill formula
 
 
 def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
@@ -202,3 +203,32 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
 
     except sqlite3.Error as e:
         raise e
+
+
+def update_boxer_stats_batch(results: List[tuple[int, str]]) -> None:
+    for _, result in results:
+        if result not in {'win', 'loss'}:
+            raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            for boxer_id, _ in results:
+                cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
+                if cursor.fetchone() is None:
+                    raise ValueError(f"Boxer with ID {boxer_id} not found.")
+
+            winner_ids = [(boxer_id,) for boxer_id, result in results if result == 'win']
+            loser_ids = [(boxer_id,) for boxer_id, result in results if result == 'loss']
+
+            # One transaction (and one commit/fsync) for the whole batch
+            if winner_ids:
+                cursor.executemany("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", winner_ids)
+            if loser_ids:
+                cursor.executemany("UPDATE boxers SET fights = fights + 1 WHERE id = ?", loser_ids)
+
+            conn.commit()
+
+    except sqlite3.Error as e:
+        raise e
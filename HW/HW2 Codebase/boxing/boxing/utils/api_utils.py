@@ -1,5 +1,9 @@
+from collections import deque
 import logging
 import os
+import random
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
 import requests
 
 from boxing.utils.logger import configure_logger
@@ -12,25 +16,61 @@ configure_logger(logger)
 RANDOM_ORG_URL = os.getenv("RANDOM_ORG_URL",
                            "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new")
 
+# How many numbers to pull per request; one batched call amortizes the
+# network round-trip across that many get_random() consumers.
+RANDOM_BATCH_SIZE = int(os.getenv("RANDOM_BATCH_SIZE", "256"))
 
-def get_random() -> float:
+# When set, fall back to Python's own RNG if random.org is unreachable
+# instead of raising (useful for offline development and CI).
+RANDOM_ORG_FALLBACK = os.getenv("RANDOM_ORG_FALLBACK", "false").lower() in {"1", "true", "yes"}
+
+_random_buffer: deque = deque()
+
+
+def _batch_url(n: int) -> str:
+    # Rewrite the num parameter of the configured URL to request n numbers
+    parts = urlparse(RANDOM_ORG_URL)
+    query = dict(parse_qsl(parts.query))
+    query["num"] = str(n)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def _refill_random_buffer(n: int = RANDOM_BATCH_SIZE) -> None:
     try:
-        response = requests.get(RANDOM_ORG_URL, timeout=5)
+        response = requests.get(_batch_url(n), timeout=5)
 
         # Check if the request was successful
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
+        numbers = []
+        for token in response.text.split():
+            try:
+                numbers.append(float(token))
+            except ValueError:
+                raise ValueError(f"Invalid response from random.org: {token}")
 
-        try:
-            random_number = float(random_number_str)
-        except ValueError:
-            raise ValueError(f"Invalid response from random.org: {random_number_str}")
+        if not numbers:
+            raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
 
-        return random_number
+        _random_buffer.extend(numbers)
 
     except requests.exceptions.Timeout:
+        if RANDOM_ORG_FALLBACK:
+            logger.warning("Request to random.org timed out; falling back to local RNG.")
+            _random_buffer.extend(random.random() for _ in range(n))
+            return
         raise RuntimeError("Request to random.org timed out.")
 
     except requests.exceptions.RequestException as e:
+        if RANDOM_ORG_FALLBACK:
+            logger.warning("Request to random.org failed (%s); falling back to local RNG.", e)
+            _random_buffer.extend(random.random() for _ in range(n))
+            return
         raise RuntimeError(f"Request to random.org failed: {e}")
+
+
+def get_random() -> float:
+    if not _random_buffer:
+        _refill_random_buffer()
+
+    return _random_buffer.popleft()
@@ -52,6 +52,13 @@ def get_db_connection():
     conn = None
     try:
         conn = sqlite3.connect(DB_PATH)
+
+        # WAL with synchronous=NORMAL avoids an fsync per transaction and
+        # lets readers run concurrently with the per-fight stat writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
         yield conn
     except sqlite3.Error as e:
         raise e